@@ -0,0 +1,169 @@
+# app/cache.py
+"""
+HTTP response cache configuration (fastapi-cache2).
+
+Here we:
+- Define a size-capped in-memory cache backend
+- Define a cache key builder based on the request URL
+- Define a coder that stores and serves already-encoded JSON as-is
+- Provide a cache decorator for endpoints returning pre-encoded JSON
+- Provide helpers to initialize the cache and to invalidate cached tasks
+"""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi_cache import FastAPICache, JsonCoder, default_key_builder
+from fastapi_cache.backends.inmemory import InMemoryBackend, Value
+from fastapi_cache.decorator import cache
+
+
+# Namespace shared by every cached read endpoint of the tasks router.
+# Write endpoints clear it after committing. Each worker process has its
+# own cache, so other workers may serve stale data until entries expire.
+TASKS_CACHE_NAMESPACE = "tasks"
+
+# Upper bound on the number of cached responses kept in memory.
+MAX_CACHE_ENTRIES = 1024
+
+
+class BoundedInMemoryBackend(InMemoryBackend):
+    """
+    In-memory backend that never holds more than `max_entries` responses.
+
+    The stock InMemoryBackend grows forever (expired keys are only dropped
+    when read again). When full, we first drop expired entries and then
+    the oldest ones (dicts keep insertion order).
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES) -> None:
+        self.max_entries = max_entries
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        expire: Optional[int] = None,
+    ) -> None:
+        async with self._lock:
+            self._store.pop(key, None)
+            if len(self._store) >= self.max_entries:
+                now = self._now
+                for old_key in [
+                    k for k, v in self._store.items() if v.ttl_ts < now
+                ]:
+                    del self._store[old_key]
+            while len(self._store) >= self.max_entries:
+                del self._store[next(iter(self._store))]
+            self._store[key] = Value(value, self._now + (expire or 0))
+
+
+class ResponseJsonCoder(JsonCoder):
+    """
+    JSON coder for endpoints returning a `Response` holding JSON bytes.
+
+    Our read endpoints return pre-encoded JSON: we cache its body as-is,
+    and on a hit we hand those same bytes back as a JSON Response. The hit
+    never goes through json.loads, response_model validation or FastAPI's
+    serializer.
+    """
+
+    @classmethod
+    def encode(cls, value: Any) -> bytes:
+        if isinstance(value, Response):
+            return value.body
+        return super().encode(value)
+
+    @classmethod
+    def decode_as_type(cls, value: bytes, *, type_: Any) -> Response:
+        return Response(content=value, media_type="application/json")
+
+
+def request_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Build a cache key from the request path and its query string.
+
+    The default key builder hashes the endpoint kwargs, which include the
+    DB session object: every request would get a different key.
+    """
+    if request is None:
+        return default_key_builder(
+            func,
+            namespace,
+            request=request,
+            response=response,
+            args=args,
+            kwargs=kwargs,
+        )
+    query = sorted(request.query_params.multi_items())
+    return f"{namespace}:{func.__name__}:{request.url.path}?{query}"
+
+
+def cache_json_response(
+    expire: int,
+    namespace: str,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """
+    Like fastapi-cache's `@cache`, for endpoints returning pre-encoded JSON.
+
+    The endpoint must accept the injected `response: Response` parameter.
+    fastapi-cache writes Cache-Control, ETag and X-FastAPI-Cache on that
+    injected response, but FastAPI ignores its headers whenever the
+    endpoint returns its own Response, which is what a cache hit does.
+    We copy them onto the returned Response.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        cached_func = cache(expire=expire, namespace=namespace)(func)
+
+        # wraps() also copies the __signature__ fastapi-cache computed, so
+        # FastAPI still sees (and injects) the right parameters.
+        @wraps(cached_func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await cached_func(*args, **kwargs)
+            injected = next(
+                (v for v in kwargs.values() if isinstance(v, Response)),
+                None,
+            )
+            if (
+                injected is not None
+                and isinstance(result, Response)
+                and result is not injected
+            ):
+                for name, value in injected.headers.items():
+                    if name not in result.headers:
+                        result.headers[name] = value
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def init_cache() -> None:
+    """
+    Set up fastapi-cache. Call it once at application startup.
+    """
+    FastAPICache.init(
+        BoundedInMemoryBackend(),
+        coder=ResponseJsonCoder,
+        key_builder=request_key_builder,
+    )
+
+
+async def invalidate_tasks_cache() -> None:
+    """
+    Drop every cached task response. Call it after a successful write.
+    """
+    await FastAPICache.clear(namespace=TASKS_CACHE_NAMESPACE)
@@ -4,37 +4,86 @@ Database configuration module.
 
 Here we:
 - Configure the SQLite database URL
-- Create the SQLAlchemy engine
-- Create a SessionLocal class to get DB sessions
+- Create the async SQLAlchemy engine (aiosqlite driver)
+- Tune every SQLite connection (WAL mode, PRAGMAs)
+- Create an AsyncSessionLocal factory to get DB sessions
 - Define a Base class for our models
 - Provide a get_db() dependency for FastAPI endpoints
 """
 
-from typing import Generator
+from typing import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 
 # SQLite database URL.
-# "sqlite:///./app.db" means: create/use app.db in the current directory.
-SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+# "sqlite+aiosqlite:///./app.db" means: create/use app.db in the current
+# directory, talking to it through the async aiosqlite driver.
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./app.db"
 
 
 # For SQLite, we need this connect_args check_same_thread=False
 # because the default SQLite driver is not fully thread-safe.
-engine = create_engine(
+#
+# We use an explicit queue pool so connections (and their page cache) are
+# reused across requests, instead of opening/closing the database file on
+# the hot path. AsyncAdaptedQueuePool is the asyncio flavour of QueuePool.
+engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=10,
+    max_overflow=10,
+    pool_pre_ping=False,
+    pool_recycle=-1,
 )
 
 
-# SessionLocal is a factory that will create new Session objects.
-# We use autocommit=False and autoflush=False for explicit control.
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
+# SQLite tuning, applied once to every new DBAPI connection:
+# - WAL lets readers keep going while a writer commits
+# - synchronous=NORMAL is safe with WAL and needs fewer fsyncs per commit
+# - busy_timeout waits for a lock instead of failing with "database is locked"
+# - a bigger page cache (64 MiB) and in-memory temp tables
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+# Pool events live on the underlying sync engine, even for async engines.
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_conn, _) -> None:
+    """
+    Configure every new SQLite connection with our PRAGMA settings.
+
+    This runs once per pooled connection, not once per request.
+    """
+    cursor = dbapi_conn.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+# AsyncSessionLocal is a factory that will create new AsyncSession objects.
+# We use autoflush=False for explicit control, and expire_on_commit=False
+# so objects stay readable after commit without an implicit (and, in async
+# code, forbidden) lazy reload.
+AsyncSessionLocal = async_sessionmaker(
     bind=engine,
+    autoflush=False,
+    expire_on_commit=False,
 )
 
 
@@ -47,18 +96,14 @@ class Base(DeclarativeBase):
     pass
 
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency used in FastAPI endpoints to get a database session.
 
     Usage in endpoints:
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 
     It yields a session and makes sure to close it after the request.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
-
@@ -5,27 +5,60 @@ FastAPI application entrypoint.
 Here we:
 - Create the FastAPI app instance
 - Configure CORS for the frontend SPA
-- Create database tables at startup
+- Monitor SQL queries per request (count and timing)
+- Optionally create database tables at startup (AUTO_CREATE_TABLES=1)
+- Set up the in-memory response cache
 - Include the tasks router
 """
 
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_sqlalchemy_monitor.action import (
+    LogStatistics,
+    WarnMaxTotalInvocation,
+)
 
+from .cache import init_cache
 from .database import Base, engine
 from .models import task_models as task_model  # noqa: F401 (import needed for table creation)
+from .monitoring import MAX_QUERIES_PER_REQUEST, BodyAwareSQLAlchemyMonitor
 from .routers import task_views as tasks_router
 
 
-# Create all tables.
-# For a real project, you would use Alembic migrations instead of create_all().
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
+
+    Code before `yield` runs once at startup, code after it at shutdown.
+    """
+    # Create all tables, only when asked to.
+    # create_all() inspects sqlite_master for every table even when they all
+    # exist, which slows down every cold start for nothing.
+    # For a real project, you would use Alembic migrations instead of create_all().
+    if os.getenv("AUTO_CREATE_TABLES") == "1":
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    init_cache()
+
+    yield
+
+    # Close every pooled connection cleanly on shutdown.
+    await engine.dispose()
 
 
 app = FastAPI(
     title="Tasks API",
     description="Simple CRUD API for tasks, used as a coding test example.",
     version="0.1.0",
+    lifespan=lifespan,
+    # orjson encodes JSON (datetimes included) much faster than stdlib json.
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -46,6 +79,25 @@ app.add_middleware(
 )
 
 
+# SQL monitoring:
+# Counts and times every query run while serving a request, logs the
+# per-request statistics and warns when a single request runs more than
+# MAX_QUERIES_PER_REQUEST queries (e.g. an accidental N+1 lazy-load loop).
+# Added last so it is the outermost middleware and sees the whole request.
+# Statistics are reported once the response body is sent, so queries run
+# while streaming (GET /tasks/stream) are counted too.
+app.add_middleware(
+    BodyAwareSQLAlchemyMonitor,
+    engine=engine,
+    actions=[
+        WarnMaxTotalInvocation(max_invocations=MAX_QUERIES_PER_REQUEST),
+        LogStatistics(),
+    ],
+    # Startup work (e.g. create_all) runs outside of any request.
+    allow_no_request_context=True,
+)
+
+
 # Include routers
 app.include_router(tasks_router.router)
 
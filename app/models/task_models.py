@@ -7,12 +7,58 @@ This defines the actual database table structure.
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    func,
+)
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import TypeDecorator
 
 from ..database import Base
 
 
+# Categories are stored as small integers instead of repeating the full
+# string in every row: smaller rows, smaller pages, smaller WAL.
+# Never renumber existing entries, only append new ones.
+CATEGORY_TO_CODE = {"work": 1, "personal": 2, "study": 3, "other": 4}
+CODE_TO_CATEGORY = {code: name for name, code in CATEGORY_TO_CODE.items()}
+
+
+class CategoryType(TypeDecorator):
+    """
+    Column type storing a category name as a SMALLINT code.
+
+    Python code (ORM objects, Core rows, Pydantic schemas) only ever sees
+    the category name; the conversion happens when binding parameters and
+    reading results, so it also applies to Core selects and RETURNING.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return CATEGORY_TO_CODE[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        # A table created before categories became codes still has a
+        # VARCHAR column: old rows hold the name, and new codes come back
+        # as text ("1") because of SQLite's type affinity. Accept both, so
+        # such a table keeps working until it is rebuilt (see the note at
+        # the bottom of Task).
+        if value in CATEGORY_TO_CODE:
+            return value
+        return CODE_TO_CATEGORY[int(value)]
+
+
 class Task(Base):
     """
     Task model mapped to the "tasks" table.
@@ -25,8 +71,14 @@ class Task(Base):
     - priority: integer from 1 to 5 (we enforce the range at Pydantic level)
     - due_date: optional datetime deadline
     - owner_email: optional string email (validated at Pydantic level)
-    - category: string category (validated at Pydantic level)
-    - created_at / updated_at: timestamps
+    - category: string category (validated at Pydantic level),
+      stored as a small integer code (see CategoryType)
+    - created_at / updated_at: timestamps, filled in by SQLite itself
+
+    Indexes:
+    - ix_tasks_completed_id on (completed, id): serves the
+      `GET /tasks?completed=...` filter and returns matches already
+      ordered by id, without scanning the whole table.
     """
 
     __tablename__ = "tasks"
@@ -60,19 +112,60 @@ class Task(Base):
     )
 
     category: Mapped[str | None] = mapped_column(
-        String(50),
+        CategoryType,
         nullable=True,
     )
 
+    # server_default / onupdate with func.now() render as CURRENT_TIMESTAMP
+    # (UTC) inside the INSERT/UPDATE statement, so Python never has to
+    # compute and bind a timestamp for each row.
+    # Existing databases need a table rebuild, see the note at the bottom.
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False,
     )
 
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False,
     )
 
+    # Upgrading an existing app.db:
+    # create_all() only creates missing tables, it never changes an existing
+    # one (no new indexes, no new column defaults).
+    #
+    # - ix_tasks_completed_id: create it once by hand:
+    #     CREATE INDEX ix_tasks_completed_id ON tasks (completed, id);
+    #
+    # - created_at / updated_at DEFAULT CURRENT_TIMESTAMP: SQLite cannot add
+    #   a default to an existing column, and without it every INSERT fails
+    #   (the columns are NOT NULL and we no longer send a value).
+    #
+    # - category as SMALLINT: an old VARCHAR(50) column keeps TEXT affinity,
+    #   so a plain UPDATE to codes is not enough (SQLite stores them back as
+    #   text). CategoryType can read such a table, but only a rebuild gets
+    #   the smaller rows.
+    #
+    # Both need the table to be rebuilt:
+    #     ALTER TABLE tasks RENAME TO tasks_old;
+    #     DROP INDEX IF EXISTS ix_tasks_id;
+    #     DROP INDEX IF EXISTS ix_tasks_completed_id;
+    #   then start the app once with AUTO_CREATE_TABLES=1 (creates the new
+    #   table and its indexes), copy the rows back and drop the old table:
+    #     INSERT INTO tasks SELECT
+    #       id, title, description, completed, priority, due_date,
+    #       owner_email,
+    #       CASE category
+    #         WHEN 'work' THEN 1 WHEN 'personal' THEN 2
+    #         WHEN 'study' THEN 3 WHEN 'other' THEN 4
+    #         ELSE category
+    #       END,
+    #       created_at, updated_at
+    #     FROM tasks_old;
+    #     DROP TABLE tasks_old;
+    __table_args__ = (
+        Index("ix_tasks_completed_id", "completed", "id"),
+    )
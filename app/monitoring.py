@@ -0,0 +1,46 @@
+# app/monitoring.py
+"""
+SQL query monitoring (fastapi-sqlalchemy-monitor).
+
+Here we:
+- Define how many queries a single request may run before we warn
+- Define a monitor middleware that reports once the response body is sent
+"""
+
+from typing import AsyncIterator, Callable
+
+from fastapi import Request
+from fastapi_sqlalchemy_monitor import SQLAlchemyMonitor
+
+
+# Warn when a single request runs more queries than this.
+MAX_QUERIES_PER_REQUEST = 5
+
+
+class BodyAwareSQLAlchemyMonitor(SQLAlchemyMonitor):
+    """
+    SQLAlchemyMonitor that runs its actions after the response body is sent.
+
+    The stock middleware runs them as soon as the endpoint returns. For a
+    StreamingResponse that is before the body, and its queries, are
+    produced, so it would always report 0 queries. Here we wrap the body
+    iterator and report once it is exhausted: one accurate report per
+    request, streaming or not.
+    """
+
+    async def _dispatch(self, request: Request, call_next: Callable):
+        self.init_statistics()
+        statistics = self.statistics
+        response = await call_next(request)
+        body_iterator = response.body_iterator
+
+        async def report_after_body() -> AsyncIterator[bytes]:
+            try:
+                async for chunk in body_iterator:
+                    yield chunk
+            finally:
+                for action in self._actions:
+                    action.handle(statistics)
+
+        response.body_iterator = report_after_body()
+        return response
@@ -3,18 +3,36 @@
 CRUD endpoints for Task.
 
 We expose:
-- GET /tasks          -> list all tasks
+- GET /tasks          -> list tasks (paginated)
+- GET /tasks/stream   -> stream every task as one JSON array (exports)
 - GET /tasks/{id}     -> get a single task
 - POST /tasks         -> create a task
+- POST /tasks/bulk    -> create many tasks in one transaction
 - PUT /tasks/{id}     -> update a task
 - DELETE /tasks/{id}  -> delete a task
 """
 
-from typing import List
+from typing import AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..cache import (
+    TASKS_CACHE_NAMESPACE,
+    cache_json_response,
+    invalidate_tasks_cache,
+)
 from ..database import get_db
 from ..models.task_models import Task as TaskModel
 from ..schemas.task_schemas import Task, TaskCreate, TaskUpdate
@@ -26,36 +44,178 @@ router = APIRouter(
 )
 
 
+# Built once at import time and reused by the read endpoints, which encode
+# their own JSON bytes instead of going through FastAPI's response_model
+# serialization on every call. response_model is still declared on those
+# routes so the OpenAPI docs keep showing the schema.
+TASK_ADAPTER = TypeAdapter(Task)
+TASK_LIST_ADAPTER = TypeAdapter(List[Task])
+
+# Number of rows fetched from the cursor (and written out) at a time by the
+# streaming endpoint.
+STREAM_CHUNK_SIZE = 500
+
+
+def task_cache(request: Request) -> Dict[int, Optional[TaskModel]]:
+    """
+    Dependency returning a per-request memo of tasks, keyed by ID.
+
+    The dict lives on `request.state`, so it is thrown away together with
+    the request and can never serve stale data to another client.
+    """
+    cache = getattr(request.state, "task_cache", None)
+    if cache is None:
+        cache = request.state.task_cache = {}
+    return cache
+
+
+def json_response(response: Response, content: bytes) -> Response:
+    """
+    Fill FastAPI's injected `response` with pre-encoded JSON and return it.
+
+    When an endpoint returns a brand new Response, FastAPI drops every
+    header set on the injected one. fastapi-cache sets Cache-Control, ETag
+    and X-FastAPI-Cache on it *after* the endpoint returns, so we send that
+    same object back instead of building a new one.
+    """
+    response.body = content
+    # The injected response has no status code yet (FastAPI fills it in
+    # only when the endpoint returns data, not a Response).
+    response.status_code = status.HTTP_200_OK
+    response.headers["content-type"] = "application/json"
+    response.headers["content-length"] = str(len(content))
+    return response
+
+
+async def get_task_by_id(
+    db: AsyncSession,
+    cache: Dict[int, Optional[TaskModel]],
+    task_id: int,
+) -> Optional[TaskModel]:
+    """
+    Fetch a task by primary key, at most once per request.
+
+    Uses `Session.get()`, which checks the identity map before going to the
+    database. Misses (None) are cached too.
+    """
+    if task_id not in cache:
+        cache[task_id] = await db.get(TaskModel, task_id)
+    return cache[task_id]
+
+
 @router.get("/", response_model=List[Task])
-def list_tasks(
+@cache_json_response(expire=30, namespace=TASKS_CACHE_NAMESPACE)
+async def list_tasks(
+    response: Response,
     completed: bool | None = Query(
         default=None,
         description="Optional filter by completion status.",
     ),
-    db: Session = Depends(get_db),
-) -> List[Task]:
+    limit: int = Query(
+        default=50,
+        ge=1,
+        le=500,
+        description="Maximum number of tasks to return.",
+    ),
+    offset: int = Query(
+        default=0,
+        ge=0,
+        description="Number of tasks to skip (ignored when after_id is set).",
+    ),
+    after_id: int | None = Query(
+        default=None,
+        description=(
+            "Keyset pagination: only return tasks with an ID greater than "
+            "this one. Pass the last ID of the previous page. Faster than "
+            "offset on big tables."
+        ),
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
     """
-    Return all tasks, optionally filtered by completion status.
+    Return one page of tasks ordered by ID, optionally filtered by
+    completion status.
     """
-    query = db.query(TaskModel)
+    # Core select on the table (not the ORM entity): we get plain rows back,
+    # without building, tracking and identity-mapping an ORM object per row.
+    # Rows expose columns as attributes, so from_attributes still works.
+    tasks_table = TaskModel.__table__
+    stmt = select(tasks_table)
     if completed is not None:
-        query = query.filter(TaskModel.completed == completed)
-    tasks = query.all()
-    return tasks
+        stmt = stmt.where(tasks_table.c.completed == completed)
+    if after_id is not None:
+        stmt = stmt.where(tasks_table.c.id > after_id)
+    else:
+        stmt = stmt.offset(offset)
+    stmt = stmt.order_by(tasks_table.c.id).limit(limit)
+    result = await db.execute(stmt)
+    tasks = TASK_LIST_ADAPTER.validate_python(
+        result.all(),
+        from_attributes=True,
+    )
+    return json_response(response, TASK_LIST_ADAPTER.dump_json(tasks))
+
+
+@router.get("/stream", response_model=List[Task])
+async def stream_tasks(
+    completed: bool | None = Query(
+        default=None,
+        description="Optional filter by completion status.",
+    ),
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse:
+    """
+    Stream every task, ordered by ID, as a single JSON array.
+
+    Rows are read from the cursor and sent in chunks of STREAM_CHUNK_SIZE,
+    so memory use does not grow with the table and the client starts
+    receiving data right away. Meant for exports / admin tools.
+    """
+    tasks_table = TaskModel.__table__
+    stmt = select(tasks_table).order_by(tasks_table.c.id)
+    if completed is not None:
+        stmt = stmt.where(tasks_table.c.completed == completed)
+    stmt = stmt.execution_options(yield_per=STREAM_CHUNK_SIZE)
+
+    async def encode_rows() -> AsyncIterator[bytes]:
+        result = await db.stream(stmt)
+        separator = b"["
+        async for rows in result.partitions():
+            tasks = TASK_LIST_ADAPTER.validate_python(
+                rows,
+                from_attributes=True,
+            )
+            # dump_json gives "[a,b,c]": strip the brackets to get "a,b,c".
+            yield separator + TASK_LIST_ADAPTER.dump_json(tasks)[1:-1]
+            separator = b","
+        yield b"]" if separator == b"," else b"[]"
+
+    return StreamingResponse(encode_rows(), media_type="application/json")
 
 
 @router.get("/{task_id}", response_model=Task)
-def get_task(task_id: int, db: Session = Depends(get_db)) -> Task:
+@cache_json_response(expire=60, namespace=TASKS_CACHE_NAMESPACE)
+async def get_task(
+    response: Response,
+    task_id: int,
+    db: AsyncSession = Depends(get_db),
+    cache: Dict[int, Optional[TaskModel]] = Depends(task_cache),
+) -> Response:
     """
     Return a single task by its ID.
     """
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    task = await get_task_by_id(db, cache, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
-    return task
+    return json_response(
+        response,
+        TASK_ADAPTER.dump_json(
+            TASK_ADAPTER.validate_python(task, from_attributes=True),
+        ),
+    )
 
 
 @router.post(
@@ -63,53 +223,114 @@ def get_task(task_id: int, db: Session = Depends(get_db)) -> Task:
     response_model=Task,
     status_code=status.HTTP_201_CREATED,
 )
-def create_task(payload: TaskCreate, db: Session = Depends(get_db)) -> Task:
+async def create_task(
+    payload: TaskCreate,
+    db: AsyncSession = Depends(get_db),
+) -> Task:
     """
     Create a new task.
     """
     task = TaskModel(**payload.model_dump())
     db.add(task)
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await db.refresh(task)
+    await invalidate_tasks_cache()
     return task
 
 
+@router.post(
+    "/bulk",
+    response_model=List[Task],
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_bulk(
+    payloads: List[TaskCreate],
+    db: AsyncSession = Depends(get_db),
+) -> List[Task]:
+    """
+    Create many tasks at once.
+
+    SQLAlchemy batches the rows into multi-row INSERT ... RETURNING
+    statements ("insertmanyvalues"), all committed in one transaction,
+    instead of one INSERT and one commit per task.
+    """
+    if not payloads:
+        return []
+
+    stmt = insert(TaskModel).returning(TaskModel)
+    result = await db.execute(stmt, [p.model_dump() for p in payloads])
+    # RETURNING rows are not guaranteed to come back in payload order.
+    # We can't ask SQLAlchemy for that (sort_by_parameter_order=True) because
+    # without an insert sentinel column it falls back to one INSERT per row.
+    # SQLite hands out increasing IDs in insertion order, so sorting by ID
+    # gives back the payload order.
+    tasks = sorted(result.scalars().all(), key=lambda task: task.id)
+    await db.commit()
+    await invalidate_tasks_cache()
+    return tasks
+
+
 @router.put("/{task_id}", response_model=Task)
-def update_task(
+async def update_task(
     task_id: int,
     payload: TaskUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> Task:
     """
     Update an existing task (partial update).
+
+    A single UPDATE ... RETURNING both modifies the row and gives it back,
+    so we don't need a SELECT first.
     """
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
+    # Only the fields the client actually sent, read straight off the model
+    # (cheaper than model_dump(exclude_unset=True) + a setattr loop).
+    update_data = {
+        name: getattr(payload, name)
+        for name in payload.model_fields_set
+    }
+    if update_data:
+        stmt = (
+            update(TaskModel)
+            .where(TaskModel.id == task_id)
+            .values(**update_data)
+            .returning(TaskModel)
+        )
+        result = await db.execute(stmt)
+        task = result.scalar_one_or_none()
+    else:
+        # Nothing to change: an empty UPDATE is invalid SQL, just read the row.
+        task = await db.get(TaskModel, task_id)
+
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
-    update_data = payload.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    db.commit()
-    db.refresh(task)
+    await db.commit()
+    await invalidate_tasks_cache()
     return task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(task_id: int, db: Session = Depends(get_db)) -> None:
+async def delete_task(
+    task_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
     """
     Delete an existing task.
+
+    A single DELETE statement; rowcount tells us whether the task existed.
+    We return the empty 204 Response ourselves, so FastAPI skips its
+    response serialization step.
     """
-    task = db.query(TaskModel).filter(TaskModel.id == task_id).first()
-    if not task:
+    result = await db.execute(delete(TaskModel).where(TaskModel.id == task_id))
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found",
         )
 
-    db.delete(task)
-    db.commit()
+    await db.commit()
+    await invalidate_tasks_cache()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
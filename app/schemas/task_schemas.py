@@ -9,9 +9,17 @@ Pydantic is used to:
 """
 
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Annotated, Literal, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+
+# Simple "something@something.tld" check.
+# Much cheaper than EmailStr (no email-validator, no IDNA/DNS-shape checks),
+# which is plenty for an internal CRUD API.
+EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+
+EmailAddress = Annotated[str, StringConstraints(pattern=EMAIL_RE)]
 
 
 class TaskBase(BaseModel):
@@ -55,7 +63,7 @@ class TaskBase(BaseModel):
         description="Optional due date for the task (deadline).",
     )
 
-    owner_email: Optional[EmailStr] = Field(
+    owner_email: Optional[EmailAddress] = Field(
         default=None,
         description="Optional email of the person responsible for this task.",
     )
@@ -112,7 +120,7 @@ class TaskUpdate(BaseModel):
         description="Optional due date for the task (deadline).",
     )
 
-    owner_email: Optional[EmailStr] = Field(
+    owner_email: Optional[EmailAddress] = Field(
         default=None,
         description="Optional email of the person responsible for this task.",
     )
@@ -136,7 +144,6 @@ class Task(TaskBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        # This tells Pydantic it can read data from ORM objects (SQLAlchemy models).
-        from_attributes = True
+    # This tells Pydantic it can read data from ORM objects (SQLAlchemy models).
+    model_config = ConfigDict(from_attributes=True)
 